@@ -1,30 +1,94 @@
 import json  # Built-in module to encode/decode JSON data
+import mmap  # Memory-maps the store file for parsing without an extra copy (load_store)
+import os    # Provides os.replace/os.fsync for atomic, durable store writes
 import sys   # Provides sys.exit for clean error exits and argv access
-import csv   # Built-in module to write CSV files (used in export_csv)
-import argparse  # Built-in module to parse command-line arguments
-from datetime import datetime  # For timestamps in UTC ISO8601 format
+from operator import itemgetter  # C-level sort keys for listing and saving entries
+import time  # For timestamps in UTC ISO8601 format (time.gmtime)
+
+try:  # orjson is an optional, much faster (native) JSON encoder/decoder
+    import orjson
+except ImportError:  # Fall back to the stdlib json module when orjson is not installed
+    orjson = None
+
+EXPORT_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for CSV export
+STORE_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for the JSON store
+
+_NOW = None  # Cached timestamp for this process (see now_iso)
+_MISSING = object()  # Sentinel for dict.pop when a key may be absent
 
 
 def current_time_in_ISO8601():
     """Return current UTC time as an ISO8601 string like 'YYYY-MM-DDTHH:MM:SSZ'."""  # Function purpose (docstring)
     # e.g., "2025-09-04T14:00:00Z"
-    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")  # Get UTC "now" and format it as ISO8601 with 'Z'
+    t = time.gmtime()  # Get UTC "now" as a struct_time (no datetime object needed)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"  # Date part
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z")  # Time part with 'Z' for UTC
+
+
+def dump_json(store, pretty=False):
+    """Serialize 'store' to UTF-8 JSON bytes, compact or pretty (2-space indent) (orjson when available)."""  # Docstring
+    if orjson is not None:  # Fast path: native serializer emits UTF-8 bytes directly
+        if pretty:  # Same 2-space layout as json.dump(indent=2)
+            return orjson.dumps(store, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(store)  # orjson is compact by default
+    if pretty:  # Stdlib fallback, encoded to bytes
+        return json.dumps(store, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(store, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def parse_json(data):
+    """Parse JSON bytes into Python objects (orjson when available, else stdlib json)."""  # Docstring
+    if orjson is not None:  # Fast path: native parser
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(data)  # Stdlib fallback accepts UTF-8 bytes too
 
 
-def init_store(path):
+def write_store_file(path, store, pretty=False):
+    """
+    Atomically write 'store' as JSON to 'path', with entries ordered by site
+    (the on-disk entry order is rewritten on every save; insertion order is not kept).
+    Output is compact unless 'pretty' is True (2-space indented, human-readable).
+    The bytes go to 'path.tmp' first, are fsynced, then renamed over 'path',
+    so a crash mid-write never leaves a truncated/corrupted store behind.
+    The store's permissions are preserved (new stores are created 0600) and a
+    symlinked 'path' is followed, so the link itself stays in place.
+    """  # Docstring explaining the atomic write
+    entries = dict(sorted(store["entries"].items(), key=itemgetter(0)))  # Persist entries in site order
+    data = dump_json({**store, "entries": entries},  # Keep every top-level section; only entries are reordered
+                     pretty=pretty)  # Compact by default: smaller file, faster encoding
+    target = os.path.realpath(path)  # Follow symlinks so the link's target is what gets replaced
+    try:
+        mode = os.stat(target).st_mode & 0o7777  # Keep the existing store's permissions (e.g. 600)
+    except FileNotFoundError:  # New store: private to the owner by default
+        mode = 0o600
+    tmp_path = target + ".tmp"  # Temporary sibling file (same directory => same filesystem for rename)
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)  # Never world-readable, even briefly
+        with open(fd, mode="wb", buffering=STORE_BUFFER_SIZE) as f:  # Wrap the descriptor for binary writing
+            f.write(data)  # One write of the whole document
+            f.flush()  # Push Python's buffer to the OS
+            os.fsync(f.fileno())  # Make sure the bytes are on disk before the rename
+        os.chmod(tmp_path, mode)  # Give the new file the old file's permissions
+        os.replace(tmp_path, target)  # Atomically swap the new file into place
+    except BaseException:  # On any failure, do not leave the temp file lying around
+        if os.path.exists(tmp_path):  # Only remove it if it was created
+            os.remove(tmp_path)  # Clean up partial temp file
+        raise  # Re-raise the original error
+
+
+def init_store(path, pretty=False):
     """Create a new empty password store on disk at 'path' and return it as a dict."""  # Explains effect + return
     store = {  # Construct the in-memory structure that matches our JSON schema
         "metadata": {  # Top-level metadata section
             "version": 1,  # Schema version for future upgrades
-            "created_at": current_time_in_ISO8601(),  # When the store was created
-            "updated_at": current_time_in_ISO8601(),  # Last time the store changed (same as created_at initially)
+            "created_at": now_iso(),  # When the store was created
+            "updated_at": now_iso(),  # Last time the store changed (same as created_at initially)
             "count": 0  # Number of entries currently stored
         },
         "entries": {}  # Actual credentials live here as site -> {username, password, last_updated}
     }
 
-    with open(path, mode="w", encoding="utf-8") as file:  # Open target file for writing (overwrite) using UTF-8
-        json.dump(store, file, indent=2, ensure_ascii=False)  # Serialize 'store' dict to pretty JSON
+    write_store_file(path, store, pretty=pretty)  # Serialize 'store' dict to JSON and write it atomically
 
     print("Created new password store at", path)  # Inform the user where the store was created
     return store  # Return the in-memory store so caller can use it
@@ -33,12 +97,20 @@ def init_store(path):
 def load_store(path):
     """Load JSON store from disk or exit with a clear message on error. Returns dict on success."""  # What/return
     try:
-        with open(path, mode="r", encoding="utf-8") as f:  # Open the JSON file for reading
-            store = json.load(f)  # Parse JSON into a Python dict
+        with open(path, mode="rb") as f:  # Open the JSON file for binary reading (no text decoding layer)
+            if orjson is not None:  # orjson can parse straight from a memory-mapped buffer
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # Map the file read-only
+                except (ValueError, OSError):  # Empty file or not mappable: use a plain read below
+                    mm = None
+                if mm is not None:
+                    with mm, memoryview(mm) as view:  # orjson takes a memoryview, not the mmap itself
+                        return orjson.loads(view)  # Parse without copying the file into a bytes object
+            store = parse_json(f.read())  # Parse JSON bytes into a Python dict
             return store  # Return the loaded store to the caller
     except FileNotFoundError:  # Triggered if the file does not exist
         sys.exit("Store file not found. Run 'init' first.")  # Exit with a helpful message
-    except json.JSONDecodeError:  # Triggered if the file contents are not valid JSON
+    except json.JSONDecodeError:  # Triggered if the file contents are not valid JSON (also covers orjson errors)
         sys.exit("Store file is corrupted. Restore or re-init.")  # Exit with a helpful message
 
 
@@ -77,19 +149,36 @@ def validate_store_schema(store):
             sys.exit("Invalid store schema: site keys must be strings.")  # Exit if not string
         if not isinstance(rec, dict):  # Each entry must be an object/dict
             sys.exit(f"Invalid store schema: entry for '{site}' is not an object.")  # Exit if wrong type
-        for key, typ in (("username", str), ("password", str), ("last_updated", str)):  # Required fields
-            if key not in rec:  # Ensure field exists
-                sys.exit(f"Invalid store schema: entry '{site}' missing '{key}'.")  # Exit if missing
-            if not isinstance(rec[key], typ):  # Ensure correct type
-                sys.exit(f"Invalid store schema: '{site}.{key}' must be {typ.__name__}.")  # Exit if wrong type
+        # Fast path: one flat check of all required fields (JSON strings are always exactly 'str')
+        if (type(rec.get("username")) is not str or type(rec.get("password")) is not str
+                or type(rec.get("last_updated")) is not str):
+            for key in ("username", "password", "last_updated"):  # Slow path only to report which field failed
+                if key not in rec:  # Ensure field exists
+                    sys.exit(f"Invalid store schema: entry '{site}' missing '{key}'.")  # Exit if missing
+                if not isinstance(rec[key], str):  # Ensure correct type
+                    sys.exit(f"Invalid store schema: '{site}.{key}' must be str.")  # Exit if wrong type
 
     if meta["count"] != len(entries):  # The metadata count must match number of entries
         sys.exit("Invalid store schema: metadata.count does not match number of entries.")  # Exit if mismatch
 
 
+def load_and_validate(path):
+    """Load the store at 'path' and validate its schema in one step. Returns the validated dict."""  # Docstring
+    store = load_store(path)  # Parse the whole file once with the native parser (exits on error)
+    validate_store_schema(store)  # Single validation walk over the parsed dict (exits on error)
+    return store  # Hand back a store that is safe to operate on
+
+
 def now_iso():
-    """Return current UTC timestamp in ISO8601 (delegates to current_time_in_ISO8601)."""  # Docstring for clarity
-    return current_time_in_ISO8601()  # Simple wrapper for naming convenience
+    """
+    Return the current UTC timestamp in ISO8601 (delegates to current_time_in_ISO8601).
+    The value is computed once and reused for the rest of the process, so every
+    timestamp written by a single CLI command is identical.
+    """  # Docstring for clarity
+    global _NOW  # Module-level cache of the timestamp for this invocation
+    if _NOW is None:  # First call in this process
+        _NOW = current_time_in_ISO8601()  # Read the clock and format once
+    return _NOW  # Reuse the cached timestamp
 
 
 def normalize_site(s):
@@ -99,39 +188,100 @@ def normalize_site(s):
 
 # ---------- CRUD ----------
 
-def add_entry(store, site, username, password):
+def insert_entry(store, site, username, password):
     """
-    Add a new site entry to the store.
-    Rules:
-      - 'site' is normalized (trim+lower)
-      - 'site' must be unique (no overwrite)
-      - 'username'/'password' cannot be empty
-      - updates metadata.count and metadata.updated_at
+    Insert a new site entry into store["entries"] without touching metadata.
+    Same rules as add_entry, but raises ValueError instead of exiting, so batch
+    callers (bulk_add) can report a bad row and carry on.
+    Returns the normalized site key.
     """  # Docstring describing contract
     if site is None:  # Must provide site name
-        sys.exit("add: site is required.")  # Exit with clear message
+        raise ValueError("add: site is required.")  # Caller decides how to report
     site_key = normalize_site(site)  # Normalize the site to a consistent key
+    if not site_key:  # Blank or whitespace-only site (e.g. an empty CSV cell)
+        raise ValueError("add: site cannot be empty.")  # Reject empty key
     if not username or not password:  # Ensure non-empty credentials
-        sys.exit("add: username and password cannot be empty.")  # Exit if empty
+        raise ValueError("add: username and password cannot be empty.")  # Reject empty
 
     entries = store["entries"]  # Shortcut to entries dict
     if site_key in entries:  # Disallow duplicates to prevent silent overwrite
-        sys.exit(f"add: entry for '{site_key}' already exists. Use 'update' instead.")  # Exit if duplicate
+        raise ValueError(f"add: entry for '{site_key}' already exists. Use 'update' instead.")  # Reject duplicate
 
     entries[site_key] = {  # Create new entry for this site
         "username": str(username),  # Store username as string
         "password": str(password),  # Store password as string
         "last_updated": now_iso()  # Set per-entry timestamp to now
     }
-    store["metadata"]["count"] = len(entries)  # Sync count with number of entries
-    store["metadata"]["updated_at"] = now_iso()  # Update global "updated_at" timestamp
+    return site_key  # Normalized key of the inserted entry
+
+
+def add_entry(store, site, username, password):
+    """
+    Add a new site entry to the store.
+    Rules:
+      - 'site' is normalized (trim+lower)
+      - 'site' must be unique (no overwrite)
+      - 'username'/'password' cannot be empty
+      - updates metadata.count and metadata.updated_at
+    Returns the normalized site key.
+    """  # Docstring describing contract
+    try:
+        site_key = insert_entry(store, site, username, password)  # Validate and insert
+    except ValueError as exc:  # Any rule violation
+        sys.exit(str(exc))  # Exit with the same clear message
+    entries = store["entries"]  # Shortcut to entries dict
+    meta = store["metadata"]  # Bind metadata once instead of re-indexing the store
+    meta["count"] = len(entries)  # Sync count with number of entries
+    meta["updated_at"] = now_iso()  # Update global "updated_at" timestamp
+    return site_key  # Normalized key, so callers need not normalize again
 
 
-def get_entry(store, site):
-    """Return entry dict for 'site' or None if not found (exits if site missing)."""  # Docstring
+def bulk_add(store, csv_path):
+    """
+    Add many entries from a CSV file with header: site,username,password
+    (extra columns such as last_updated are ignored, so exports can be re-imported).
+    Bad rows are skipped and reported; metadata is updated once for the whole batch.
+    Exits with a 'bulk-add:' message if the file cannot be read or parsed as CSV.
+    Returns (number of entries added, list of error messages).
+    """  # Docstring describing contract
+    import csv  # Imported lazily: only CSV commands need the csv module
+    added = 0  # Number of rows inserted
+    errors = []  # One message per skipped row
+    try:
+        with open(csv_path, mode="r", newline="", encoding="utf-8-sig") as f:  # Open CSV; -sig drops an Excel BOM
+            reader = csv.DictReader(f)  # Rows as dicts keyed by the header
+            if not reader.fieldnames or not {"site", "username", "password"} <= set(reader.fieldnames):
+                sys.exit("bulk-add: CSV header must contain site,username,password.")  # Exit if header wrong
+            for row in reader:  # Iterate data rows
+                try:
+                    insert_entry(store, row["site"], row["username"], row["password"])  # Validate and insert
+                    added += 1  # Count successful inserts
+                except ValueError as exc:  # Rule violation: skip this row only
+                    errors.append(f"line {reader.line_num}: {exc}")  # Remember where it failed
+    except FileNotFoundError:  # CSV path does not exist
+        sys.exit(f"bulk-add: file not found: {csv_path}")  # Exit with a helpful message
+    except OSError as exc:  # Directory, permission denied, I/O error...
+        sys.exit(f"bulk-add: cannot read {csv_path}: {exc.strerror or exc}")  # Exit with a helpful message
+    except UnicodeDecodeError:  # File is not UTF-8 text
+        sys.exit(f"bulk-add: {csv_path} is not a UTF-8 CSV file.")  # Exit with a helpful message
+    except csv.Error as exc:  # Malformed CSV (e.g. NUL bytes)
+        sys.exit(f"bulk-add: malformed CSV in {csv_path}: {exc}")  # Exit with a helpful message
+
+    if added:  # Only touch metadata if something changed
+        meta = store["metadata"]  # Bind metadata once
+        meta["count"] = len(store["entries"])  # Sync count with number of entries
+        meta["updated_at"] = now_iso()  # Update global "updated_at" timestamp
+    return added, errors  # Report results to caller
+
+
+def get_entry(store, site, normalized=False):
+    """
+    Return entry dict for 'site' or None if not found (exits if site missing).
+    Pass normalized=True when 'site' is already a normalized key (skips normalize_site).
+    """  # Docstring
     if site is None:  # Must provide site name
         sys.exit("get: site is required.")  # Exit with clear message
-    site_key = normalize_site(site)  # Normalize key for consistent lookup
+    site_key = site if normalized else normalize_site(site)  # Normalize key for consistent lookup
     return store["entries"].get(site_key, None)  # Return entry or None if absent
 
 
@@ -142,6 +292,7 @@ def update_entry(store, site, username=None, password=None):
       - 'site' is required
       - at least one of username/password must be provided
       - updates entry.last_updated and metadata.updated_at
+    Returns the normalized site key.
     """  # Docstring
     if site is None:  # Must provide site name
         sys.exit("update: site is required.")  # Exit with message
@@ -150,36 +301,38 @@ def update_entry(store, site, username=None, password=None):
 
     site_key = normalize_site(site)  # Normalize lookup key
     entries = store["entries"]  # Shortcut to entries
-    if site_key not in entries:  # Ensure site exists
+    rec = entries.get(site_key)  # Single lookup: fetch the entry (None if absent)
+    if rec is None:  # Ensure site exists
         sys.exit(f"update: no entry found for '{site_key}'.")  # Exit if missing
 
     if username is not None:  # If username update requested
         if not username:  # Disallow empty username
             sys.exit("update: username cannot be empty.")  # Exit if empty
-        entries[site_key]["username"] = str(username)  # Apply username change
+        rec["username"] = str(username)  # Apply username change
 
     if password is not None:  # If password update requested
         if not password:  # Disallow empty password
             sys.exit("update: password cannot be empty.")  # Exit if empty
-        entries[site_key]["password"] = str(password)  # Apply password change
+        rec["password"] = str(password)  # Apply password change
 
-    entries[site_key]["last_updated"] = now_iso()  # Refresh per-entry timestamp
+    rec["last_updated"] = now_iso()  # Refresh per-entry timestamp
     store["metadata"]["updated_at"] = now_iso()  # Refresh global updated_at
+    return site_key  # Normalized key, so callers need not normalize again
 
 
 def delete_entry(store, site):
-    """Delete an entry by site name and update metadata count/updated_at."""  # Docstring
+    """Delete an entry by site name and update metadata count/updated_at. Returns the normalized site key."""
     if site is None:  # Require site name
         sys.exit("delete: site is required.")  # Exit with message
     site_key = normalize_site(site)  # Normalize key for consistency
     entries = store["entries"]  # Shortcut to entries
 
-    if site_key not in entries:  # Must exist to delete
+    if entries.pop(site_key, _MISSING) is _MISSING:  # Remove the entry in one lookup; sentinel means it was absent
         sys.exit(f"delete: no entry found for '{site_key}'.")  # Exit if missing
-
-    del entries[site_key]  # Remove the entry from the dictionary
-    store["metadata"]["count"] = len(entries)  # Recompute count after deletion
-    store["metadata"]["updated_at"] = now_iso()  # Update global updated_at
+    meta = store["metadata"]  # Bind metadata once instead of re-indexing the store
+    meta["count"] = len(entries)  # Recompute count after deletion
+    meta["updated_at"] = now_iso()  # Update global updated_at
+    return site_key  # Normalized key, so callers need not normalize again
 
 
 # ---------- Listing / Search / Export / Stats ----------
@@ -189,15 +342,17 @@ def list_entries(store, sort_key="site"):
     Return a list of tuples: (site, username, last_updated).
     Sorting:
       - sort_key='site' (default) sorts alphabetically by site
-      - sort_key='last_updated' sorts by timestamp (ISO string compares chronologically)
+      - sort_key='last_updated' sorts by timestamp (ISO string compares chronologically);
+        ties (e.g. all rows from one bulk-add share a timestamp) keep site order, because
+        saving stores entries in site order and the sort is stable
     """  # Docstring explaining return/sort
     rows = [(site, rec["username"], rec["last_updated"])  # Build (site, username, last_updated) tuples
             for site, rec in store["entries"].items()]  # Iterate over all entries in the store
 
     if sort_key == "last_updated":  # If caller wants chronological ordering
-        rows.sort(key=lambda t: t[2])  # Sort by the ISO timestamp (string compares chronologically)
+        rows.sort(key=itemgetter(2))  # Sort by the ISO timestamp (string compares chronologically)
     else:  # Default sorting path
-        rows.sort(key=lambda t: t[0])  # Sort by site name alphabetically
+        rows.sort(key=itemgetter(0))  # Sort by site name; entries are saved in site order, so this is one linear pass
 
     return rows  # Return the sorted list of tuples
 
@@ -210,10 +365,8 @@ def search_entries(store, keyword):
     if not keyword:  # If keyword is empty/None
         return []  # No results by definition
     k = keyword.lower()  # Normalize search keyword to lowercase
-    hits = []  # Accumulate matching site names here
-    for site, rec in store["entries"].items():  # Scan all entries
-        if k in site.lower() or k in rec["username"].lower():  # Match on site or username (case-insensitive)
-            hits.append(site)  # Keep the site key if it matches
+    hits = [site for site, rec in store["entries"].items()  # Scan all entries
+            if k in site.lower() or k in rec["username"].lower()]  # Match on site or username (case-insensitive)
     hits.sort()  # Sort results alphabetically for stable output
     return hits  # Return the list of matches
 
@@ -224,14 +377,15 @@ def export_csv(store, out_path):
       site,username,password,last_updated
     Returns the number of rows written (excluding the header).
     """  # Docstring explains format and return
-    count = 0  # Will count data rows written (not counting header)
-    with open(out_path, mode="w", newline="", encoding="utf-8") as f:  # Open CSV for writing
+    import csv  # Imported lazily: only the export command needs the csv module
+    entries = store["entries"]  # Shortcut to entries
+    with open(out_path, mode="w", newline="", encoding="utf-8",
+              buffering=EXPORT_BUFFER_SIZE) as f:  # Open CSV for writing with a large buffer (fewer write syscalls)
         writer = csv.writer(f)  # Create a simple CSV writer
         writer.writerow(["site", "username", "password", "last_updated"])  # Write header row
-        for site, rec in store["entries"].items():  # Iterate all entries
-            writer.writerow([site, rec["username"], rec["password"], rec["last_updated"]])  # Write one row
-            count += 1  # Increment number of written entries
-    return count  # Return the number of data rows written
+        writer.writerows((site, rec["username"], rec["password"], rec["last_updated"])  # One row per entry,
+                         for site, rec in entries.items())  # consumed by csv in a single call
+    return len(entries)  # Return the number of data rows written
 
 
 def stats(store):
@@ -253,11 +407,16 @@ def stats(store):
             "avg_password_length": 0.0
         }
 
-    times = [rec["last_updated"] for rec in entries.values()]  # Collect timestamps
-    pw_lengths = [len(rec["password"]) for rec in entries.values()]  # Collect password lengths
-    oldest = min(times)  # ISO strings: min is chronologically oldest
-    newest = max(times)  # ISO strings: max is chronologically newest
-    avg_len = sum(pw_lengths) / len(pw_lengths)  # Average password length as float
+    oldest = newest = None  # Running min/max of last_updated (ISO strings compare chronologically)
+    total_len = 0  # Running sum of password lengths
+    for rec in entries.values():  # Single pass over all entries, no intermediate lists
+        t = rec["last_updated"]  # Timestamp of this entry
+        if oldest is None or t < oldest:  # New chronological minimum
+            oldest = t
+        if newest is None or t > newest:  # New chronological maximum
+            newest = t
+        total_len += len(rec["password"])  # Accumulate password length
+    avg_len = total_len / total  # Average password length as float
 
     return {  # Package the computed stats
         "count": total,
@@ -269,23 +428,111 @@ def stats(store):
 
 # ---------- Save (Step 7) ----------
 
-def save_store(path, store):
+def save_store(path, store, pretty=False):
     """
-    Persist the store to disk (simple overwrite write).
-    For extra safety you could write to a temp file then rename atomically.
-    """  # Docstring with optional improvement hint
+    Persist the store to disk.
+    Writes to a temp file then renames it over 'path' atomically (see write_store_file).
+    JSON is compact unless 'pretty' is True.
+    """  # Docstring
     store["metadata"]["updated_at"] = now_iso()  # Update global updated_at before writing
-    with open(path, mode="w", encoding="utf-8") as f:  # Open target JSON file for writing
-        json.dump(store, f, indent=2, ensure_ascii=False)  # Serialize store back to disk (pretty JSON)
+    write_store_file(path, store, pretty=pretty)  # Serialize store back to disk, atomically
 
 
 # ---------- CLI parsing ----------
 
+# Fast-path CLI spec: command -> (positional names, {option flag: dest}, {dest: allowed choices}, required dests)
+COMMANDS = {
+    "init": ((), {}, {}, ()),
+    "add": (("site", "username", "password"), {}, {}, ()),
+    "get": (("site",), {}, {}, ()),
+    "update": (("site",), {"--username": "username", "--password": "password"}, {}, ()),
+    "delete": (("site",), {}, {}, ()),
+    "list": ((), {"--sort": "sort"}, {"sort": ("site", "last_updated")}, ()),
+    "search": (("keyword",), {}, {}, ()),
+    "export": ((), {"--out": "out"}, {}, ("out",)),
+    "stats": ((), {}, {}, ()),
+    "bulk-add": ((), {"--from": "source"}, {}, ("source",)),
+}
+OPTION_DEFAULTS = {"sort": "site"}  # Defaults for options that are not None when omitted
+
+
+def fast_parse_args(argv):
+    """
+    Parse the common, well-formed command lines without building the argparse parser.
+    Returns a SimpleNamespace shaped like argparse's result, or None when anything is
+    unusual (--help, unknown flags, missing values, bad choices...) so argparse can handle it.
+    """  # Docstring
+    from types import SimpleNamespace  # Lightweight attribute container (same access as Namespace)
+
+    values = {"file": "store.json", "pretty": False}  # Global option defaults
+    i = 0  # Cursor into argv
+    n = len(argv)  # Number of tokens
+    while i < n and argv[i].startswith("-"):  # Global options come before the command
+        arg = argv[i]  # Current token
+        if arg in ("--file", "-f") and i + 1 < n and not argv[i + 1].startswith("-"):  # '--file PATH'
+            values["file"] = argv[i + 1]  # Store path is the next token
+            i += 2  # Skip flag and value
+        elif arg.startswith("--file="):  # '--file=PATH'
+            values["file"] = arg[len("--file="):]  # Store path follows the '='
+            i += 1  # Skip the combined token
+        elif arg == "--pretty":  # '--pretty' flag
+            values["pretty"] = True  # Write indented JSON
+            i += 1  # Skip the flag
+        else:  # Anything else (e.g. --help): let argparse deal with it
+            return None  # Fall back to argparse
+    if i == n or argv[i] not in COMMANDS:  # Missing or unknown command
+        return None  # Fall back to argparse for the usage error
+
+    command = argv[i]  # Subcommand name
+    positional_names, options, choices, required = COMMANDS[command]  # This command's spec
+    values["command"] = command  # Same attribute argparse sets via dest="command"
+    values.update((dest, OPTION_DEFAULTS.get(dest)) for dest in options.values())  # Options default to None
+
+    positionals = []  # Collected positional values, in order
+    i += 1  # Move past the command name
+    while i < n:  # Walk the command's own tokens
+        arg = argv[i]  # Current token
+        i += 1  # Consume it
+        if not arg.startswith("-"):  # Positional value
+            positionals.append(arg)  # Keep it; names are assigned below
+            continue  # Next token
+        flag, eq, value = arg.partition("=")  # Support both '--opt value' and '--opt=value'
+        if flag not in options:  # Unknown flag (or -h/--help)
+            return None  # Fall back to argparse
+        if not eq:  # Value is the next token
+            if i == n or argv[i].startswith("-"):  # Missing value
+                return None  # Fall back to argparse for the error message
+            value = argv[i]  # Take the next token as the value
+            i += 1  # Consume it
+        values[options[flag]] = value  # Last occurrence wins, like argparse
+
+    if (len(positionals) != len(positional_names)  # Wrong number of positionals,
+            or any(values[dest] not in allowed for dest, allowed in choices.items())  # a bad choice,
+            or any(values[dest] is None for dest in required)):  # or a missing required option
+        return None  # Fall back to argparse for the error message
+    values.update(zip(positional_names, positionals))  # Name the positionals
+    return SimpleNamespace(**values)  # Same attribute access as argparse.Namespace
+
+
 def parse_args(argv=None):
     """
-    Define and parse command-line interface using argparse with subcommands.
-    Returns an argparse.Namespace containing all parsed arguments/options.
+    Parse command-line arguments. Well-formed invocations use the hand-written
+    fast_parse_args; anything else (including --help and errors) goes through argparse.
+    Returns a namespace containing all parsed arguments/options.
     """  # Docstring
+    argv = sys.argv[1:] if argv is None else argv  # Default to the real command line
+    args = fast_parse_args(argv)  # Common case: no argparse at all
+    if args is not None:
+        return args
+    return build_parser().parse_args(argv)  # Help, usage errors and edge cases
+
+
+def build_parser():
+    """
+    Define the command-line interface using argparse with subcommands.
+    Used for --help and error reporting; must stay in sync with COMMANDS.
+    """  # Docstring
+    import argparse  # Imported lazily: only needed for help/errors
     parser = argparse.ArgumentParser(  # Create the top-level parser
         prog="passman.py",  # Program name shown in help
         description="Simple Password Manager (CLI) — educational use only."  # Help description
@@ -295,6 +542,11 @@ def parse_args(argv=None):
         default="store.json",  # Default path when not provided
         help="Path to the JSON store file (default: store.json)"  # Help text for the option
     )
+    parser.add_argument(  # Global flag: write indented JSON instead of compact
+        "--pretty",
+        action="store_true",  # False unless given
+        help="Write the store as indented, human-readable JSON (default: compact)"  # Help text
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)  # Set up subcommands; require one command
 
@@ -342,7 +594,14 @@ def parse_args(argv=None):
     # stats subcommand (no extra args)
     subparsers.add_parser("stats", help="Show basic statistics.")  # 'stats' parser
 
-    return parser.parse_args(argv)  # Parse argv (or sys.argv if None) and return Namespace
+    # bulk-add subcommand
+    p_bulk = subparsers.add_parser("bulk-add", help="Add many entries from a CSV file.")  # 'bulk-add' parser
+    p_bulk.add_argument(  # Require source CSV path ('from' is a keyword, so store it as 'source')
+        "--from", dest="source", required=True, metavar="PATH",
+        help="CSV file with header site,username,password"  # Help text
+    )
+
+    return parser  # Caller parses argv with it
 
 
 # ---------- main ----------
@@ -353,46 +612,55 @@ def main():
 
     # 'init' does not need an existing store on disk:
     if args.command == "init":  # If the user wants to create a new store
-        init_store(args.file)  # Build and write a fresh store to args.file
+        init_store(args.file, pretty=args.pretty)  # Build and write a fresh store to args.file
         return  # Nothing else to do for init
 
     # For all other commands we need a valid existing store:
-    store = load_store(args.file)  # Read and parse JSON store from disk
-    validate_store_schema(store)  # Ensure the file structure is correct before operating
+    store = load_and_validate(args.file)  # Read, parse and validate the JSON store from disk
 
     if args.command == "add":  # 'add' subcommand logic
-        add_entry(store, args.site, args.username, args.password)  # Insert a new entry
-        save_store(args.file, store)  # Persist changes to disk
-        print(f"Added: {normalize_site(args.site)} ({args.username})")  # Confirmation output
+        site_key = add_entry(store, args.site, args.username, args.password)  # Insert a new entry
+        save_store(args.file, store, pretty=args.pretty)  # Persist changes to disk
+        print(f"Added: {site_key} ({args.username})")  # Confirmation output
+
+    elif args.command == "bulk-add":  # 'bulk-add' subcommand logic
+        added, errors = bulk_add(store, args.source)  # Insert all valid rows in memory
+        for message in errors:  # Report each skipped row
+            print(f"bulk-add: skipped {message}", file=sys.stderr)  # Errors go to stderr
+        if added:  # Only rewrite the store if something changed
+            save_store(args.file, store, pretty=args.pretty)  # Persist once for the whole batch
+        print(f"Added {added} entries ({len(errors)} skipped)")  # Summary output
 
     elif args.command == "get":  # 'get' subcommand logic
-        entry = get_entry(store, args.site)  # Lookup entry by site
+        site_key = normalize_site(args.site)  # Normalize once for lookup and output
+        entry = get_entry(store, site_key, normalized=True)  # Lookup by the already-normalized key
         if entry is None:  # If not found
-            print(f"No entry found for {normalize_site(args.site)}")  # Inform user
+            print(f"No entry found for {site_key}")  # Inform user
         else:  # Found: print fields plainly (note: not secure for real passwords)
-            print("site:", normalize_site(args.site))  # Show normalized site
+            print("site:", site_key)  # Show normalized site
             print("username:", entry["username"])  # Show username
             print("password:", entry["password"])  # Show password (educational only)
             print("last_updated:", entry["last_updated"])  # Show last updated timestamp
 
     elif args.command == "update":  # 'update' subcommand logic
-        update_entry(store, args.site, username=args.username, password=args.password)  # Apply changes
-        save_store(args.file, store)  # Persist changes to disk
-        print(f"Updated: {normalize_site(args.site)}")  # Confirmation output
+        site_key = update_entry(store, args.site, username=args.username, password=args.password)  # Apply changes
+        save_store(args.file, store, pretty=args.pretty)  # Persist changes to disk
+        print(f"Updated: {site_key}")  # Confirmation output
 
     elif args.command == "delete":  # 'delete' subcommand logic
-        delete_entry(store, args.site)  # Remove the entry
-        save_store(args.file, store)  # Persist changes to disk
-        print(f"Deleted: {normalize_site(args.site)}")  # Confirmation output
+        site_key = delete_entry(store, args.site)  # Remove the entry
+        save_store(args.file, store, pretty=args.pretty)  # Persist changes to disk
+        print(f"Deleted: {site_key}")  # Confirmation output
 
     elif args.command == "list":  # 'list' subcommand logic
         rows = list_entries(store, sort_key=args.sort)  # Build (site, username, last_updated) rows with sorting
         if not rows:  # No entries at all
             print("(empty)")  # Friendly empty message
         else:  # Print a simple aligned table
-            print("SITE".ljust(12), "USERNAME".ljust(16), "LAST_UPDATED")  # Header with spacing
-            for site, username, last_updated in rows:  # Iterate over rows
-                print(site.ljust(12), username.ljust(16), last_updated)  # Print each row aligned
+            out = [f"{'SITE'.ljust(12)} {'USERNAME'.ljust(16)} LAST_UPDATED\n"]  # Header with spacing
+            out.extend(f"{site.ljust(12)} {username.ljust(16)} {last_updated}\n"  # Each row aligned
+                       for site, username, last_updated in rows)
+            sys.stdout.write("".join(out))  # Emit the whole table in a single write
 
     elif args.command == "search":  # 'search' subcommand logic
         hits = search_entries(store, args.keyword)  # Search by keyword in site and username